@@ -8,7 +8,7 @@ from sklearn.utils.multiclass import check_classification_targets
 from sklearn.preprocessing import LabelBinarizer, LabelEncoder
 from sklearn.utils.class_weight import compute_class_weight
 
-from scipy.special import expit
+from scipy.special import expit, logsumexp
 
 from yaglm.config.loss import get_loss_config
 from yaglm.config.base_params import get_base_config
@@ -18,6 +18,40 @@ from yaglm.metrics.glm_log_liks import gaussian, bernoulli, multinomial,\
 from yaglm.utils import lb_transform_to_indices
 
 
+def identity(z):
+    return z
+
+
+# maps the loss name to the inverse link function that
+# takes the decision function to E[Y|X]
+loss2inv_link = {'lin_reg': identity,
+                 'huber': identity,
+                 'quantile': identity,
+                 'l2': identity,
+                 'smoothed_quantile': identity,
+
+                 'poisson': np.exp,
+
+                 'log_reg': expit,
+
+                 'multinomial': softmax
+                 }
+
+# maps the loss name to the default score function
+loss2score_func = {'lin_reg': r2_score,
+                   'huber': r2_score,
+                   'quantile': r2_score,
+                   'poisson': poisson_dsq_score,
+                   'smoothed_quantile': r2_score,
+
+                   'log_reg': accuracy_score,
+                   'multinomial': accuracy_score,
+                   'hinge': accuracy_score,
+                   'huberized_hinge': accuracy_score,
+                   'logistic_hinge': accuracy_score
+                   }
+
+
 class LossMixin:
     """
     Mixin for Glm estimators that handles functionality related to the loss function e.g. predict.
@@ -121,20 +155,10 @@ class LossMixin:
         y_pred = self.predict(X, offsets=offsets)
         loss_config = get_base_config(get_loss_config(self.loss))
 
-        if loss_config.name in ['lin_reg', 'huber', 'quantile', 'poisson',
-                                'smoothed_quantile']:
-            return r2_score(y_true=y, y_pred=y_pred,
-                            sample_weight=sample_weight)
-
-        elif loss_config.name == 'poisson':
-            return poisson_dsq_score(y_true=y, y_pred=y_pred,
-                                     sample_weight=sample_weight)
-
-        elif loss_config.name in ['log_reg', 'multinomial',
-                                  'hinge', 'huberized_hinge',
-                                  'logistic_hinge']:
-            return accuracy_score(y_true=y, y_pred=y_pred,
-                                  sample_weight=sample_weight)
+        score_func = loss2score_func.get(loss_config.name, None)
+        if score_func is not None:
+            return score_func(y_true=y, y_pred=y_pred,
+                              sample_weight=sample_weight)
 
     def predict_proba(self, X, offsets=None):
         """"
@@ -178,7 +202,21 @@ class LossMixin:
             The logs of the probabilities either for class 1 (for logistic regression) or for all the classes (for multinomial.)
 
         """
-        return np.log(self.predict_proba(X, offsets=offsets))
+        loss_config = get_base_config(get_loss_config(self.loss))
+        if loss_config.name not in ['log_reg', 'multinomial']:
+            raise ValueError("{} does not support predict_log_proba".
+                             format(loss_config.name))
+
+        # compute the log probabilities directly from the decision function
+        # which is more numerically stable than taking the log of the
+        # probabilities
+        z = self.decision_function(X, offsets=offsets)
+
+        if loss_config.name == 'log_reg':
+            return -np.logaddexp(0, -z)
+
+        elif loss_config.name == 'multinomial':
+            return z - logsumexp(z, axis=1, keepdims=True)
 
     def predict_expected(self, X, offsets=None):
         """
@@ -202,22 +240,11 @@ class LossMixin:
         z = self.decision_function(X, offsets=offsets)
         loss_config = get_base_config(get_loss_config(self.loss))
 
-        if loss_config.name in ['lin_reg', 'huber', 'quantile', 'l2',
-                                'smoothed_quantile']:
-            return z
-
-        elif loss_config.name == 'poisson':
-            return np.exp(z)
-
-        elif loss_config.name == 'log_reg':
-            return expit(z)
-
-        elif loss_config.name == 'multinomial':
-            return softmax(z)
-
-        else:
+        if loss_config.name not in loss2inv_link:
             raise NotImplementedError
 
+        return loss2inv_link[loss_config.name](z)
+
     def sample_log_liks(self, X, y, offsets=None):
         """
         Returns the sample log-likelihood of the predictions.
@@ -299,7 +326,8 @@ def basic_y_formatting(X, y, copy=True, check_input=True, is_clf=False,
         if is_clf:
             check_classification_targets(y)
         else:
-            y = y.astype(X.dtype)
+            # y has already been copied if requested
+            y = y.astype(X.dtype, copy=False)
 
     return y
 
@@ -168,7 +168,6 @@ def get_penalty(coef, config):
     elif isinstance(config, GroupLasso):
 
         func = group_lasso_penalty
-        pen_val = cp.Parameter(value=config.pen_val, pos=True)
 
         # get the pen_val and weights correctly as cp.Parameter
         pen_val, weights = \
@@ -184,7 +183,6 @@ def get_penalty(coef, config):
     # multi task Lasso
     elif isinstance(config, MultiTaskLasso):
         func = multi_task_lasso_penalty
-        pen_val = cp.Parameter(value=config.pen_val, pos=True)
 
         # get the pen_val and weights correctly as cp.Parameter
         pen_val, weights = \
@@ -214,7 +212,6 @@ def get_penalty(coef, config):
     # Generalized Lasso
     elif isinstance(config, GeneralizedLasso):
         func = gen_lasso_penalty
-        pen_val = cp.Parameter(value=config.pen_val, pos=True)
 
         # get the pen_val and weights correctly as cp.Parameter
         pen_val, weights = \
@@ -301,7 +298,7 @@ def update_pen_val_and_weights(config, pen_val, weights):
     # Generalized ridge
     elif isinstance(config, GeneralizedRidge):
         # generalized ridge has no weights
-        pen_val.value = config.pen_Val
+        pen_val.value = config.pen_val
 
     # additive penalties
     elif isinstance(config, (SeparableSum, OverlappingSum)):
@@ -32,8 +32,8 @@ def smallest_sval(X, solver='lobpcg', **kws):
 
 def leading_sval(X, solver='lobpcg', **kws):
     """
-    Computes the smallest singular value of a matrix using
-    scipy.sparse.linalg.svds
+    Computes the largest singular value of a matrix using
+    scipy.sparse.linalg.svds. Small dense matrices use a full SVD.
 
     Parameters
     ----------
@@ -54,7 +54,14 @@ def leading_sval(X, solver='lobpcg', **kws):
     if min(X.shape) == 1:
         return np.sqrt((X.reshape(-1) ** 2).sum())
 
-    return svds(X, k=1, which='LM', solver=solver, **kws)[1].item()
+    # for small dense matrices the full SVD is cheaper than
+    # setting up an iterative solver
+    if isinstance(X, np.ndarray) and min(X.shape) <= 10:
+        return np.linalg.svd(X, compute_uv=False)[0]
+
+    # we only need the singular value so don't compute the vectors
+    return svds(X, k=1, which='LM', solver=solver,
+                return_singular_vectors=False, **kws).max()
 
 
 def euclid_norm(x):
@@ -6,7 +6,7 @@ def poisson_dsq_score(y_true, y_pred, sample_weight=None,
                       multioutput='uniform_average'):
 
     if y_pred.ndim == 1:
-        return _poisson_dsq(y=y_true, y_pred=y_pred,
+        return _poisson_dsq(y_true=y_true, y_pred=y_pred,
                             sample_weight=sample_weight)
     else:
 
@@ -19,7 +19,7 @@ def poisson_dsq_score(y_true, y_pred, sample_weight=None,
             return scores
 
         elif multioutput == 'uniform_average':
-            return y_true.mean(axis=1)
+            return scores.mean()
 
         else:
             raise ValueError("Bad input to multioutput: {}".format(multioutput))
@@ -51,7 +51,8 @@ def _poisson_dsq(y_true, y_pred, sample_weight=None):
         D^2 of self.predict(X) w.r.t. y.
     """
     poi = PoissonDistribution()
-    dev = poi.deviance(y_true, y_pred, weights=sample_weight)
+    weights = 1 if sample_weight is None else sample_weight
+    dev = poi.deviance(y_true, y_pred, weights=weights)
     y_mean = np.average(y_true, weights=sample_weight)
-    dev_null = poi.deviance(y_true, y_mean, weights=sample_weight)
+    dev_null = poi.deviance(y_true, y_mean, weights=weights)
     return 1 - dev / dev_null
@@ -54,7 +54,7 @@ from functools import partial
 
 
 def check_accepts_offsets(func):
-    'offsets' in inspect.getargspec(func).args
+    return 'offsets' in inspect.getfullargspec(func).args
 
 
 class _BaseScorer(_sk_BaseScorer):
@@ -95,7 +95,7 @@ class _BaseScorer(_sk_BaseScorer):
         )
 
 
-class _PredictScorer(_sk_PredictScorer):
+class _PredictScorer(_BaseScorer, _sk_PredictScorer):
     def _score(self, method_caller, estimator, X, y_true,
                sample_weight=None, offsets=None):
         """Evaluate predicted target values for X relative to y_true.
@@ -142,7 +142,7 @@ class _PredictScorer(_sk_PredictScorer):
             return self._sign * self._score_func(y_true, y_pred, **self._kwargs)
 
 
-class _ProbaScorer(_sk_ProbaScorer):
+class _ProbaScorer(_BaseScorer, _sk_ProbaScorer):
     def _score(self, method_caller, clf, X, y,
                sample_weight=None, offsets=None):
         """Evaluate predicted probabilities for X relative to y_true.
@@ -197,7 +197,7 @@ class _ProbaScorer(_sk_ProbaScorer):
             return self._sign * self._score_func(y, y_pred, **self._kwargs)
 
 
-class _ThresholdScorer(_sk_ThresholdScorer):
+class _ThresholdScorer(_BaseScorer, _sk_ThresholdScorer):
     def _score(self, method_caller, clf, X, y,
                sample_weight=None, offsets=None):
         """Evaluate decision function output for X relative to y_true.
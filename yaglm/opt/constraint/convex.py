@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.linalg import solve_triangular
 
 from yaglm.opt.base import Func
 
@@ -16,10 +17,7 @@ class Constraint(Func):
 class Positive(Constraint):
 
     def _prox(self, x, step=1):
-        p = np.zeros_like(x)
-        pos_mask = x > 0
-        p[pos_mask] = x[pos_mask]
-        return p
+        return np.fmax(x, 0)
 
     @property
     def is_proximable(self):
@@ -55,6 +53,79 @@ class L1Ball(Constraint):
         return True
 
 
+class Isotonic(Constraint):
+    """
+    Constrains the input to be isotonic. For matrix shaped inputs the constraint is applied to each column.
+
+    Parameters
+    ----------
+    increasing: bool
+        Whether the input should be increasing or decreasing.
+    """
+    def __init__(self, increasing=True):
+        self.increasing = increasing
+
+    def _prox(self, x, step=1):
+        if x.ndim == 1:
+            return project_isotonic(x, increasing=self.increasing)
+        else:
+            return np.apply_along_axis(project_isotonic, axis=0, arr=x,
+                                       increasing=self.increasing)
+
+    @property
+    def is_proximable(self):
+        return True
+
+
+class LinearEquality(Constraint):
+    """
+    Constrains the input to satisfy a linear equality constraint
+
+    mat @ x = eq
+
+    For matrix shaped inputs the constraint is applied to each column.
+
+    Parameters
+    ----------
+    mat: array-like, shape (n_eq, n_features) or (n_features, )
+        The matrix transform; a 1d array is treated as a single equality. Must have full row rank i.e. no redundant equalities.
+
+    eq: array-like, shape (n_eq, )
+        The equality constraint.
+    """
+    def __init__(self, mat, eq):
+        if mat is None or eq is None:
+            raise ValueError("Both mat and eq must be provided "
+                             "for a linear equality constraint")
+
+        self.mat = np.atleast_2d(mat)
+        self.eq = np.array(eq).reshape(-1)
+
+        # cache a reduced QR decomposition of mat.T = Q R so the
+        # projection only requires a few matrix-vector products
+        self.Q_, self.R_ = np.linalg.qr(self.mat.T, mode='reduced')
+
+        # R is only invertible when mat has full row rank
+        r_diag = abs(np.diag(self.R_))
+        tol = max(self.mat.shape) * np.finfo(float).eps * \
+            r_diag.max(initial=0)
+        if self.mat.shape[0] > self.mat.shape[1] or \
+                not np.all(r_diag > tol):
+            raise ValueError("mat must have full row rank")
+
+    def _prox(self, x, step=1):
+        eq = self.eq if x.ndim == 1 else self.eq.reshape(-1, 1)
+        residue = self.mat @ x - eq
+
+        # the projection is x - mat.T (mat mat.T)^{-1} residue
+        # which simplifies to x - Q R^{-T} residue
+        return x - self.Q_ @ solve_triangular(self.R_, residue, trans='T')
+
+    @property
+    def is_proximable(self):
+        return True
+
+
 # See https://gist.github.com/mblondel/6f3b7aaad90606b98f71
 # for more algorithms.
 def project_simplex(v, z=1):
@@ -64,13 +135,41 @@ def project_simplex(v, z=1):
     n_features = v.shape[0]
     u = np.sort(v)[::-1]
     cssv = np.cumsum(u) - z
-    ind = np.arange(n_features) + 1
-    cond = u - cssv / ind > 0
-    rho = ind[cond][-1]
-    theta = cssv[cond][-1] / rho
-    w = np.maximum(v - theta, 0)
+    ind = np.arange(1, n_features + 1)
+
+    # the condition u - cssv / ind > 0 holds for a prefix of the sorted
+    # entries so rho is just the number of entries where it holds
+    rho = np.count_nonzero(u * ind > cssv)
+    theta = cssv[rho - 1] / rho
+
+    w = v - theta
+    np.maximum(w, 0, out=w)
     return w
 
 
 def project_l1_ball(v, z=1):
-    return np.sign(v) * project_simplex(np.abs(v), z)
+    # project_simplex either returns its input or a new array so p never
+    # aliases v; we can write the signs of v into p unless it is an
+    # integer array, which happens when an integer v is inside the ball
+    p = project_simplex(np.abs(v), z)
+    if np.issubdtype(p.dtype, np.floating):
+        return np.copysign(p, v, out=p)
+    else:
+        return np.sign(v) * p
+
+
+def project_isotonic(v, increasing=True):
+    try:
+        # sklearn's private PAVA kernel skips the input validation
+        # and extra copies of sklearn.isotonic.isotonic_regression
+        from sklearn._isotonic import _inplace_contiguous_isotonic_regression
+    except ImportError:
+        from sklearn.isotonic import isotonic_regression
+        return isotonic_regression(v, increasing=increasing)
+
+    # the kernel supports float32 and float64 so keep v's floating dtype
+    dtype = v.dtype if v.dtype in [np.float32, np.float64] else np.float64
+    order = slice(None) if increasing else slice(None, None, -1)
+    p = np.array(v[order], dtype=dtype)
+    _inplace_contiguous_isotonic_regression(p, np.ones_like(p))
+    return p[order]
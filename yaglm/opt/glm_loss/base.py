@@ -191,16 +191,23 @@ class Glm(Func):
         """
         Computes the gradient when the coefficeint is zero and the intercept is set to the minimizer of the loss function when the coefficient is held at zero.
         """
-        zero = self.get_zero_coef()
+        # the linear predictor is constant when the coefficient is zero
+        # so we can skip computing X @ coef and get the gradient
+        # from a single X.T @ sample_grads product
+        if self.y.ndim in [0, 1]:
+            z_shape = (self.X.shape[0], )
+        else:
+            z_shape = (self.X.shape[0], self.y.shape[1])
+
+        # keep single precision data in single precision so the
+        # X.T @ sample_grads product does not upcast X
+        z = np.zeros(z_shape, dtype=np.result_type(self.X.dtype, np.float32))
 
         if self.fit_intercept:
-            intercept = self.intercept_at_coef_eq0()
-            coef = self.cat_intercept_coef(intercept, zero)
-            grad = self.grad(coef)
-            return grad[1:]  # ignore the gradient of the intercept
+            z += self.intercept_at_coef_eq0()
 
-        else:
-            return self.grad(zero)
+        sample_grads = self.glm_loss.grad(z)
+        return self.X.T @ sample_grads
 
     def intercept_at_coef_eq0(self):
         raise NotImplementedError
@@ -16,15 +16,9 @@ def huber_eval_1d(r, knot=1):
 vec_huber_eval = safe_vectorize(huber_eval_1d)
 
 
-def huber_grad_1d(r, knot=1):
-
-    if abs(r) <= knot:
-        return r
-    else:
-        return knot * np.sign(r)
-
-
-vec_huber_grad = safe_vectorize(huber_grad_1d)
+def vec_huber_grad(r, knot=1):
+    # the huber gradient is r clipped to [-knot, knot]
+    return np.clip(r, -knot, knot)
 
 
 def huber_prox_1d(z, y, knot=1, step=1):
@@ -76,8 +70,7 @@ def huberized_mean_1d(values, knot=1, sample_weight=None, **kws):
     """
 
     def score(x):
-        scores = np.array([huber_grad_1d(r=x - v, knot=knot)
-                           for v in values.ravel()])
+        scores = vec_huber_grad(r=x - values.ravel(), knot=knot)
         return np.average(scores, weights=sample_weight)
 
     avg = np.average(values, weights=sample_weight)
@@ -1,6 +1,7 @@
 import numpy as np
 from scipy.special import logsumexp
-from scipy.sparse import diags
+from scipy.sparse import diags, issparse
+from scipy.sparse.linalg import LinearOperator
 
 from yaglm.opt.glm_loss.base import GlmMultiResp, GlmInputLoss
 from yaglm.opt.utils import safe_entrywise_mult
@@ -61,3 +62,40 @@ class Multinomial(GlmMultiResp):
         else:
             col_sums = (diags(self.sample_weight) @ self.y).sum(axis=0)
             return np.array(col_sums).ravel() / self.X.shape[0]
+
+    def grad_at_coef_eq0(self):
+        if self.offsets is not None:
+            return super().grad_at_coef_eq0()
+
+        # when the coefficient is zero every sample has the same
+        # class probabilities so the gradient is a rank one update
+        # of X^T y and we never need to form a (n_samples, n_classes) matrix
+        if self.fit_intercept:
+            intercept = self.intercept_at_coef_eq0()
+        else:
+            intercept = np.zeros(self.intercept_shape_)
+        probs = np.exp(intercept - logsumexp(intercept))
+
+        # LinearOperators (e.g. centered sparse X) cannot multiply sparse y
+        y = self.y
+        if issparse(y) and isinstance(self.X, LinearOperator):
+            y = y.toarray()
+
+        if self.sample_weight is None:
+            # X.T @ 1 rather than X.sum() so LinearOperator X works
+            X_sum = self.X.T @ np.ones(self.X.shape[0])
+            Xt_y = self.X.T @ y
+        else:
+            X_sum = self.X.T @ self.sample_weight
+            Xt_y = self.X.T @ (diags(self.sample_weight) @ y)
+
+        if issparse(Xt_y):
+            Xt_y = Xt_y.toarray()
+
+        X_sum = np.array(X_sum).ravel()
+        grad = np.outer(X_sum, probs) - np.array(Xt_y)
+        grad /= self.X.shape[0]
+
+        # keep single precision data in single precision
+        return grad.astype(np.result_type(self.X.dtype, np.float32),
+                           copy=False)
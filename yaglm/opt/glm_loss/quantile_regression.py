@@ -44,18 +44,16 @@ Quantile Regression
 tilted_L1_prox = safe_vectorize(tilted_L1_prox_1d)
 
 
-def _tilted_L1_grad_1d(x, quantile=0.5):
-    if x == 0:
-        return 0
-
-    elif x < 0:
-        return - (1 - quantile)
-
-    else:
-        return quantile
-
-
-tilted_L1_grad = safe_vectorize(_tilted_L1_grad_1d)
+def tilted_L1_grad(x, quantile=0.5):
+    """
+    tilted_L1_grad(x; quant) = quant        if x > 0
+                               0            if x = 0
+                               quant - 1    if x < 0
+    """
+    # this is the derivative of 0.5 * |x| + (quant - 0.5) * x
+    # and keeps the dtype of x e.g. for single precision data
+    s = np.sign(x)
+    return 0.5 * s + (quantile - 0.5) * abs(s)
 
 
 def weighted_quantile_1d(values, q=0.5,
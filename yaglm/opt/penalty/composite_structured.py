@@ -2,6 +2,7 @@ import numpy as np
 from scipy.linalg import svd
 
 from yaglm.opt.base import Func
+from yaglm.opt.utils import compile_groups, get_group_norms
 from yaglm.linalg_utils import euclid_norm
 from yaglm.autoassign import autoassign
 from yaglm.opt.penalty.convex import Ridge
@@ -34,7 +35,9 @@ class CompositeL2Norm(Func):
 class CompositeGroup(Func):
 
     @autoassign
-    def __init__(self, groups, func): pass
+    def __init__(self, groups, func):
+        # flatten the groups once so the group computations are vectorized
+        self.flat_idxs, self.group_ids = compile_groups(groups)
 
     @property
     def is_smooth(self):
@@ -44,30 +47,31 @@ class CompositeGroup(Func):
     def is_proximable(self):
         return self.func.is_proximable
 
+    def _get_group_norms(self, x):
+        return get_group_norms(x, flat_idxs=self.flat_idxs,
+                               group_ids=self.group_ids,
+                               n_groups=len(self.groups))
+
     def eval(self, x):
-        norms = np.array([euclid_norm(x[grp_idxs])
-                         for grp_idxs in self.groups])
-        return self.func.eval(norms)
+        return self.func.eval(self._get_group_norms(x))
 
     def _prox(self, x, step=1):
         # compute prox of the norms
-        norms = np.array([euclid_norm(x[grp_idxs])
-                         for grp_idxs in self.groups])
+        norms = self._get_group_norms(x)
         norm_proxs = self.func.prox(norms, step=step)
 
-        out = np.zeros_like(x)
-
-        for g, grp_idxs in enumerate(self.groups):
+        # group prox, if non-zero
+        scales = np.zeros_like(norms)
+        non_zero = norm_proxs > np.finfo(float).eps
+        scales[non_zero] = norm_proxs[non_zero] / norms[non_zero]
 
-            if norm_proxs[g] > np.finfo(float).eps:
-
-                # group prox, if non-zero
-                p = x[grp_idxs] * (norm_proxs[g] / norms[g])
-
-                # put entries back into correct place
-                for p_idx, x_idx in enumerate(grp_idxs):
-                    out[x_idx] = p[p_idx]
+        # put entries back into correct place
+        grp_scales = scales[self.group_ids]
+        if x.ndim > 1:
+            grp_scales = grp_scales.reshape((-1, ) + (1, ) * (x.ndim - 1))
 
+        out = np.zeros_like(x)
+        out[self.flat_idxs] = x[self.flat_idxs] * grp_scales
         return out
 
 
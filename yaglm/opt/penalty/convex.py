@@ -2,8 +2,9 @@ import numpy as np
 from scipy.linalg import svd
 
 from yaglm.opt.base import Func, EntrywiseFunc
-from yaglm.opt.convex_funcs import L2Norm, SquaredL1
+from yaglm.opt.convex_funcs import SquaredL1
 from yaglm.opt.prox import soft_thresh, L2_prox
+from yaglm.opt.utils import compile_groups, get_group_norms
 from yaglm.linalg_utils import euclid_norm, leading_sval
 
 
@@ -194,37 +195,55 @@ class GroupLasso(Func):
     """
     def __init__(self, groups, pen_val=1.0, weights=None):
 
-        # if groups=None put everything in one group
-        if groups is None:
-            groups = [...]
         self.groups = groups
 
+        # flatten the groups once so the group norms and the prox
+        # can be vectorized instead of looping over the groups
+        # if groups=None we put everything in one group
+        if groups is None:
+            n_groups = 1
+            self.flat_idxs, self.group_ids = None, None
+        else:
+            n_groups = len(groups)
+            self.flat_idxs, self.group_ids = compile_groups(groups)
+
         if weights is None:
-            self.pen_funcs = [L2Norm(mult=pen_val)
-                              for g in range(len(groups))]
+            self.mults = pen_val * np.ones(n_groups)
         else:
-            self.pen_funcs = [L2Norm(mult=pen_val * weights[g])
-                              for g in range(len(groups))]
+            self.mults = pen_val * np.array(weights).reshape(-1)
+
+    def _get_group_norms(self, x):
+        if self.groups is None:
+            return np.array([euclid_norm(x)])
+        else:
+            return get_group_norms(x, flat_idxs=self.flat_idxs,
+                                   group_ids=self.group_ids,
+                                   n_groups=len(self.groups))
 
     def _eval(self, x):
-        return sum(self.pen_funcs[g]._eval(x[grp_idxs])
-                   for g, grp_idxs in enumerate(self.groups))
+        return self.mults @ self._get_group_norms(x)
 
     def _prox(self, x, step):
 
-        out = np.zeros_like(x)
+        # the L2 prox shrinks each group by 1 - step * mult_g / ||x_g||_2
+        # or sets it to zero if ||x_g||_2 <= step * mult_g
+        norms = self._get_group_norms(x)
+        thresh = step * self.mults
 
-        for g, grp_idxs in enumerate(self.groups):
-            # prox of group
-            p = self.pen_funcs[g]._prox(x[grp_idxs], step=step)
+        scales = np.zeros_like(norms)
+        non_zero = norms > thresh
+        scales[non_zero] = 1 - thresh[non_zero] / norms[non_zero]
 
-            # put entries back into correct place
-            if grp_idxs == ...:  # group of everything
-                out = p
-            else:
-                for p_idx, x_idx in enumerate(grp_idxs):
-                    out[x_idx] = p[p_idx]
+        if self.groups is None:
+            return x * scales[0]
 
+        # put entries back into correct place
+        grp_scales = scales[self.group_ids]
+        if x.ndim > 1:
+            grp_scales = grp_scales.reshape((-1, ) + (1, ) * (x.ndim - 1))
+
+        out = np.zeros_like(x)
+        out[self.flat_idxs] = x[self.flat_idxs] * grp_scales
         return out
 
     @property
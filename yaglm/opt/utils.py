@@ -176,6 +176,62 @@ def sign_never_0(x):
     return s
 
 
+def compile_groups(groups):
+    """
+    Flattens a list of groups into contiguous index arrays so computations over the groups can be vectorized.
+
+    Parameters
+    ----------
+    groups: list of array-like
+        The indices of each group.
+
+    Output
+    ------
+    flat_idxs, group_ids
+
+    flat_idxs: array-like of ints
+        The concatenated group indices.
+
+    group_ids: array-like of ints
+        The group each entry of flat_idxs belongs to.
+    """
+    group_sizes = [len(grp_idxs) for grp_idxs in groups]
+
+    flat_idxs = np.concatenate([np.asarray(grp_idxs, dtype=np.intp).
+                                reshape(-1) for grp_idxs in groups])
+    group_ids = np.repeat(np.arange(len(groups), dtype=np.intp), group_sizes)
+
+    return flat_idxs, group_ids
+
+
+def get_group_norms(x, flat_idxs, group_ids, n_groups):
+    """
+    Computes the euclidean norm of each group of x (or the frobenius norm of each group of rows if x is a matrix).
+
+    Parameters
+    ----------
+    x: array-like, shape (n_features, ) or (n_features, n_responses)
+        The array whose group norms we want.
+
+    flat_idxs, group_ids: array-like of ints
+        The output of compile_groups.
+
+    n_groups: int
+        The number of groups.
+
+    Output
+    ------
+    norms: array-like, shape (n_groups, )
+        The group norms.
+    """
+    sq = x[flat_idxs] ** 2
+    if sq.ndim > 1:
+        sq = sq.reshape(sq.shape[0], -1).sum(axis=1)
+
+    # bincount is a segment sum that also handles empty groups correctly
+    return np.sqrt(np.bincount(group_ids, weights=sq, minlength=n_groups))
+
+
 def safe_vectorize(pyfunc, *args, **kwargs):
     """
     Same as np.vectorize, but ensures the otype is a float. This prevents very bizare behavior where np.vectorize thinkgs something is an int when it should be a float.
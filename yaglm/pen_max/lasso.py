@@ -1,6 +1,7 @@
 import numpy as np
 
 from yaglm.linalg_utils import leading_sval
+from yaglm.opt.utils import compile_groups, get_group_norms
 from yaglm.opt.from_config.loss import get_glm_loss_func
 
 
@@ -36,10 +37,8 @@ def get_lasso_pen_max(X, y, loss, fit_intercept, weights=None,
 def lasso_max(grad, weights=None):
 
     if weights is not None:
-        penalized_mask = get_is_pen_mask(weights)
-
         # technically this is a hack but this gives the correct formula
-        grad = grad[penalized_mask] / weights[penalized_mask]
+        grad = grad * get_pen_inv_weights(weights)
 
     return abs(grad.ravel()).max()
 
@@ -49,23 +48,20 @@ def mult_task_lasso_max(grad, weights=None):
     row_norms = np.linalg.norm(grad, axis=1)
 
     if weights is not None:
-        penalized_mask = get_is_pen_mask(weights)
-
-        row_norms = row_norms[penalized_mask] / weights[penalized_mask]
+        row_norms = row_norms * get_pen_inv_weights(weights)
 
-    return max(row_norms)
+    return row_norms.max()
 
 
 def group_lasso_max(grad, groups, weights=None):
 
-    group_norms = np.array([np.linalg.norm(grad[grp_idxs])
-                            for grp_idxs in groups])
+    flat_idxs, group_ids = compile_groups(groups)
+    group_norms = get_group_norms(grad, flat_idxs=flat_idxs,
+                                  group_ids=group_ids, n_groups=len(groups))
 
     if weights is not None:
-        penalized_mask = get_is_pen_mask(weights)
-
         # technically this is a hack but this gives the correct formula
-        group_norms = group_norms[penalized_mask] / weights[penalized_mask]
+        group_norms = group_norms * get_pen_inv_weights(weights)
 
     return group_norms.max()
 
@@ -80,26 +76,33 @@ def nuclear_norm_max(grad, weights=None):
         # this is correct if the largest sval has the smallest weight
         # it is still correct otherwise, but could be conservative
         # however we expect large svals to have small weights
-        penalized_mask = get_is_pen_mask(weights)
-        smallest_weight = weights[penalized_mask].min()
-        return sval_max / smallest_weight
+        # i.e. divide by the smallest penalized weight
+        return sval_max * get_pen_inv_weights(weights).max()
 
 
-def is_nonzero_weight(w):
+def get_pen_inv_weights(weights):
     """
-    Whether or not an entry of a weights vector is non-zero
+    Computes the reciprocals of the penalized entries of a weights vector. The entries that are not penalized are set to zero so they drop out of the max computations.
+
+    Parameters
+    ----------
+    weights: array-like
+        The input weights
+
+    Output
+    ------
+    inv_weights: array-like
+        The inverse weights.
     """
-    if w is not None \
-            and not np.isnan(w) \
-            and abs(w) > np.finfo(float).eps:
-        return True
-    else:
-        return False
+    weights = np.array(weights, dtype=float)
+    inv_weights = np.zeros_like(weights)
+    np.divide(1, weights, out=inv_weights, where=get_is_pen_mask(weights))
+    return inv_weights
 
 
 def get_is_pen_mask(weights):
     """
-    Find the entries of a weights vector that are penalized
+    Find the entries of a weights vector that are penalized i.e. are not None, nan or zero.
 
     Parameters
     ----------
@@ -111,7 +114,6 @@ def get_is_pen_mask(weights):
     non_zero_mask: array-like
 
     """
-    weights = np.array(weights)
-    return np.array([is_nonzero_weight(w)
-                     for w in weights.reshape(-1)]).\
-        reshape(weights.shape)
+    # casting to float maps None entries to nan
+    weights = np.array(weights, dtype=float)
+    return ~(np.isnan(weights) | (abs(weights) <= np.finfo(float).eps))
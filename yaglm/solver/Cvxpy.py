@@ -110,17 +110,22 @@ class Cvxpy(GlmSolverWithPath):
 
         # setup initialization
         self.coef_.value = coef_init
-        self.intercept_.value = intercept_init
+        if self.intercept_ is not None:
+            self.intercept_.value = intercept_init
+
+        # warm start from the initializer e.g. the previous solution
+        # along a path; cp_kws can override this
+        cp_kws = {'warm_start': coef_init is not None, **self.cp_kws}
 
         # solve the problem
         start_time = time()
         self.problem_.solve(solver=self.solver, verbose=self.verbose,
-                            **self.cp_kws)
+                            **cp_kws)
         runtime = time() - start_time
 
         # TODO: should we copy here?
         coef = clip_zero(self.coef_.value, zero_tol=self.zero_tol)
-        soln = {'coef': coef}
+        soln = {'coef': coef, 'intercept': None}
         if self.intercept_ is not None:
             soln['intercept'] = self.intercept_.value
 
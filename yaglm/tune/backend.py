@@ -728,7 +728,7 @@ def fit_and_score(solver_data, solver, path_algo, solver_init,
             tr_kws = {} if offsets_train is None else {'offsets': offsets_train}
 
             # train score
-            tr = scorer(estimator=base_estimator, X=X_train, y=y_train,
+            tr = scorer(estimator=base_estimator, X=X_train, y_true=y_train,
                         sample_weight=sample_weight_train,
                         **tr_kws
                         )